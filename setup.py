@@ -27,8 +27,11 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=[
-        "beautifulsoup4>=4.9.0",
+        "lxml>=4.6.0",
+        "cssselect>=1.1.0",
         "requests>=2.25.0",
+        "aiohttp>=3.8.0",
+        "brotli>=1.0.9",
         "python-dateutil>=2.8.0",
     ],
 )
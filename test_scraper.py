@@ -2,9 +2,20 @@
 """
 Simple tests for the news scraper.
 """
+
+import io
+import os
+import tempfile
+import time
 import unittest
-from unittest.mock import patch, MagicMock
-from news_scraper import NewsArticle, NewsScraper, NYTimesScraper
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from unittest.mock import patch, AsyncMock, MagicMock
+import brotli
+from urllib3 import HTTPResponse
+from news_scraper import NewsArticle, NewsScraper, NYTimesScraper, BBCScraper
+from news_scraper.news_scraper import _parse_worker, _reserve_request_slot
 
 
 class TestNewsArticle(unittest.TestCase):
@@ -44,11 +55,42 @@ class TestNewsArticle(unittest.TestCase):
         self.assertIsNone(article_dict["date"])
         self.assertEqual(article_dict["categories"], ["news", "test"])
 
+    def test_lazy_date(self):
+        """Test that string dates are parsed only when first read."""
+        article = NewsArticle(
+            "Title",
+            "Content",
+            "https://example.com",
+            "example.com",
+            date="2024-03-09T12:00:00Z",
+        )
+
+        self.assertEqual(article._date_raw, "2024-03-09T12:00:00Z")
+        self.assertEqual(article.date, datetime(2024, 3, 9, 12, tzinfo=timezone.utc))
+        self.assertIsNone(article._date_raw)
+        self.assertEqual(article.to_dict()["date"], "2024-03-09T12:00:00+00:00")
+
+    def test_lazy_date_invalid(self):
+        """Test that an unparseable date reads as None."""
+        article = NewsArticle(
+            "Title", "Content", "https://example.com", "example.com", date="soon"
+        )
+
+        self.assertIsNone(article.date)
+
+    def test_slots(self):
+        """Test that articles do not carry a per-instance __dict__."""
+        article = NewsArticle("Title", "Content", "https://example.com", "example.com")
+
+        self.assertFalse(hasattr(article, "__dict__"))
+        with self.assertRaises(AttributeError):
+            article.extra = "value"
+
 
 class TestNewsScraper(unittest.TestCase):
     def setUp(self):
         """Set up a test scraper."""
-        self.scraper = NewsScraper("https://example.com")
+        self.scraper = NewsScraper("https://example.com", rate_limit=0)
 
     def test_initialization(self):
         """Test scraper initialization."""
@@ -57,17 +99,313 @@ class TestNewsScraper(unittest.TestCase):
         self.assertIsNotNone(self.scraper.headers)
         self.assertIsNotNone(self.scraper.user_agents)
 
-    @patch("requests.get")
-    def test_make_request(self, mock_get):
+    def test_make_request(self):
         """Test making a request."""
         mock_response = MagicMock()
         mock_response.text = "<html><body><h1>Test</h1></body></html>"
-        mock_get.return_value = mock_response
 
-        response = self.scraper._make_request("https://example.com/test")
+        with patch.object(
+            self.scraper.session, "get", return_value=mock_response
+        ) as mock_get:
+            response = self.scraper._make_request("https://example.com/test")
 
         mock_get.assert_called_once()
         self.assertEqual(response, mock_response)
+        _, kwargs = mock_get.call_args
+        self.assertIn(kwargs["headers"]["User-Agent"], self.scraper.user_agents)
+        self.assertEqual(kwargs["timeout"], 10)
+        self.assertTrue(kwargs["stream"])
+
+    def test_parse_response(self):
+        """Test parsing a streamed response and releasing its connection."""
+        mock_response = MagicMock(
+            raw=io.BytesIO(b"<html><h1>Streamed</h1></html>"), headers={}
+        )
+
+        tree = self.scraper._parse_response(mock_response)
+
+        self.assertEqual(self.scraper._extract_title(tree), "Streamed")
+        self.assertTrue(mock_response.raw.decode_content)
+        mock_response.close.assert_called_once()
+
+    def test_parse_response_charset(self):
+        """Test decoding by header charset, then <meta charset>, then UTF-8."""
+        cases = [
+            ({"Content-Type": "text/html; charset=iso-8859-1"}, b"", "latin-1"),
+            ({}, b'<meta charset="windows-1252">', "cp1252"),
+            ({}, b"", "utf-8"),
+        ]
+        url = "https://example.com/test"
+
+        async def fetch_and_parse(response):
+            session = MagicMock()
+            session.get.return_value.__aenter__.return_value = response
+            queue = asyncio.Queue()
+            await self.scraper._afetch(session, url, asyncio.Semaphore(1), queue)
+            await queue.put(None)
+            return await self.scraper._aparse_queue(queue, None)
+
+        for headers, meta, codec in cases:
+            body = meta + "<h1>Café</h1>".encode(codec)
+            with self.subTest(codec=codec, path="sync"):
+                response = MagicMock(raw=io.BytesIO(body), headers=headers)
+
+                tree = self.scraper._parse_response(response)
+
+                self.assertEqual(self.scraper._extract_title(tree), "Café")
+
+            with self.subTest(codec=codec, path="async"):
+                response = MagicMock(status=200, headers=headers)
+                response.read = AsyncMock(return_value=body)
+
+                articles = asyncio.run(fetch_and_parse(response))
+
+                self.assertEqual(articles[url].title, "Café")
+
+    def test_rate_limit_is_shared_per_domain(self):
+        """Test that scrapers for the same domain share one rate limiter."""
+        first = NewsScraper("https://limited.example.com", rate_limit=0.05)
+        second = NewsScraper("https://limited.example.com/news", rate_limit=0.05)
+
+        with patch("news_scraper.news_scraper.time.sleep") as mock_sleep:
+            first._respect_rate_limit()
+            second._respect_rate_limit()
+
+        mock_sleep.assert_called_once()
+        self.assertAlmostEqual(mock_sleep.call_args[0][0], 0.05, delta=0.01)
+        self.assertEqual(_reserve_request_slot("other.example.com", 0.05), 0)
+
+    def test_async_rate_limit_spaces_requests(self):
+        """Test that concurrent coroutines are spaced by the rate limit."""
+        scraper = NewsScraper("https://async.example.com", rate_limit=0.05)
+        started = []
+
+        async def request():
+            await scraper._arespect_rate_limit()
+            started.append(time.monotonic())
+
+        async def run():
+            await asyncio.gather(request(), request(), request())
+
+        asyncio.run(run())
+
+        gaps = [later - earlier for earlier, later in zip(started, started[1:])]
+        self.assertTrue(all(gap >= 0.04 for gap in gaps), gaps)
+
+    def test_rotate_user_agent(self):
+        """Test cycling through user agents without touching shared headers."""
+        agents = [self.scraper._rotate_user_agent() for _ in self.scraper.user_agents]
+
+        self.assertEqual(agents, self.scraper.user_agents)
+        self.assertEqual(self.scraper._rotate_user_agent(), agents[0])
+        self.assertNotIn("User-Agent", self.scraper.headers)
+
+    def test_parse_response_decodes_brotli(self):
+        """Test that brotli-compressed streamed bodies are decoded before parsing."""
+        body = brotli.compress(b"<html><h1>Compressed</h1></html>")
+        raw = HTTPResponse(
+            body=io.BytesIO(body),
+            headers={"Content-Encoding": "br"},
+            preload_content=False,
+        )
+
+        tree = self.scraper._parse_response(MagicMock(raw=raw, headers={}))
+
+        self.assertEqual(self.scraper._extract_title(tree), "Compressed")
+        self.assertIn("br", self.scraper.session.headers["Accept-Encoding"])
+
+    def test_session_reuses_headers(self):
+        """Test that the pooled session carries the default headers."""
+        self.assertEqual(
+            self.scraper.session.headers["Accept-Language"],
+            self.scraper.headers["Accept-Language"],
+        )
+        self.assertIn("https://", self.scraper.session.adapters)
+
+    def test_fetch_article_revalidates_cached_article(self):
+        """Test that re-fetches send validators and reuse the article on 304."""
+        url = "https://example.com/test"
+        fresh = MagicMock(
+            status_code=200, raw=io.BytesIO(b"<html><h1>Test</h1></html>")
+        )
+        fresh.headers = {"ETag": '"abc"', "Last-Modified": "Mon, 01 Jan 2024"}
+        not_modified = MagicMock(status_code=304)
+
+        with patch.object(
+            self.scraper.session, "get", side_effect=[fresh, not_modified]
+        ) as mock_get, patch.object(self.scraper, "_respect_rate_limit"):
+            first = self.scraper.fetch_article(url)
+            second = self.scraper.fetch_article(url)
+
+        first_headers = mock_get.call_args_list[0][1]["headers"]
+        second_headers = mock_get.call_args_list[1][1]["headers"]
+        self.assertNotIn("If-None-Match", first_headers)
+        self.assertEqual(second_headers["If-None-Match"], '"abc"')
+        self.assertEqual(second_headers["If-Modified-Since"], "Mon, 01 Jan 2024")
+        self.assertIs(second, first)
+        self.assertEqual(second.title, "Test")
+
+    def test_fetch_latest_articles(self):
+        """Test fetching latest articles concurrently and dropping failures."""
+        urls = ["https://example.com/a", "https://example.com/b"]
+        article = NewsArticle("Title", "Content", urls[0], "example.com")
+
+        with patch.object(
+            self.scraper, "_get_article_urls", return_value=urls
+        ), patch.object(
+            self.scraper, "_afetch", new=AsyncMock(side_effect=[article, None])
+        ) as mock_afetch:
+            articles = self.scraper.fetch_latest_articles(limit=2)
+
+        self.assertEqual(mock_afetch.await_count, 2)
+        self.assertEqual(articles, [article])
+
+    def test_afetch(self):
+        """Test fetching an article asynchronously and queueing its body."""
+        mock_response = MagicMock(status=200, headers={})
+        mock_response.read = AsyncMock(return_value=b"<html><h1>Test</h1></html>")
+        mock_session = MagicMock()
+        mock_session.get.return_value.__aenter__.return_value = mock_response
+
+        async def fetch():
+            queue = asyncio.Queue()
+            result = await self.scraper._afetch(
+                mock_session, "https://example.com/test", asyncio.Semaphore(1), queue
+            )
+            return result, queue.get_nowait()
+
+        result, item = asyncio.run(fetch())
+
+        mock_response.raise_for_status.assert_called_once()
+        self.assertIsNone(result)
+        self.assertEqual(
+            item, ("https://example.com/test", b"<html><h1>Test</h1></html>", None)
+        )
+
+    def test_aparse_queue_survives_cache_errors(self):
+        """Test that a failed cache write drops one article, not the consumer."""
+        urls = ["https://example.com/a", "https://example.com/b"]
+
+        class FailingCache(dict):
+            def __setitem__(self, key, value):
+                if key == urls[0]:
+                    raise OSError("disk full")
+                super().__setitem__(key, value)
+
+        self.scraper._article_cache = FailingCache()
+
+        async def consume():
+            queue = asyncio.Queue()
+            for url in urls:
+                html = f"<html><h1>{url[-1]}</h1></html>".encode()
+                await queue.put((url, html, None))
+            await queue.put(None)
+            return await self.scraper._aparse_queue(queue, None)
+
+        articles = asyncio.run(consume())
+
+        self.assertEqual(list(articles), urls[1:])
+        self.assertEqual(articles[urls[1]].title, "b")
+
+    def test_fetch_latest_articles_pipeline(self):
+        """Test downloading and parsing articles through the worker pool."""
+        urls = ["https://example.com/a", "https://example.com/b"]
+        pages = {url: f"<html><h1>{url[-1]}</h1></html>".encode() for url in urls}
+
+        def get(url, **kwargs):
+            response = MagicMock(status=200, headers={})
+            response.read = AsyncMock(return_value=pages[url])
+            context = MagicMock()
+            context.__aenter__.return_value = response
+            return context
+
+        mock_session = MagicMock()
+        mock_session.get.side_effect = get
+
+        with patch.object(self.scraper, "_get_article_urls", return_value=urls), patch(
+            "news_scraper.news_scraper.aiohttp.ClientSession"
+        ) as mock_cls:
+            mock_cls.return_value.__aenter__.return_value = mock_session
+            articles = self.scraper.fetch_latest_articles(limit=2)
+
+        self.assertEqual([article.title for article in articles], ["a", "b"])
+        self.assertEqual([article.url for article in articles], urls)
+        self.assertEqual(mock_cls.call_args[1]["timeout"].total, 10)
+
+    def test_fetch_latest_articles_bounds_pages_in_flight(self):
+        """Test that a slow parse pool holds back further downloads."""
+        urls = [f"https://example.com/{i}" for i in range(20)]
+        outstanding = []
+        peak = []
+
+        def get(url, **kwargs):
+            outstanding.append(url)
+            peak.append(len(outstanding))
+            response = MagicMock(status=200, headers={})
+            response.read = AsyncMock(return_value=b"<html><h1>Title</h1></html>")
+            context = MagicMock()
+            context.__aenter__.return_value = response
+            return context
+
+        def slow_parse(scraper_cls, html, content_type=None):
+            time.sleep(0.005)
+            fields = _parse_worker(scraper_cls, html, content_type)
+            outstanding.pop()
+            return fields
+
+        mock_session = MagicMock()
+        mock_session.get.side_effect = get
+
+        with patch.object(self.scraper, "_get_article_urls", return_value=urls), patch(
+            "news_scraper.news_scraper.aiohttp.ClientSession"
+        ) as mock_cls, patch(
+            "news_scraper.news_scraper.ProcessPoolExecutor", ThreadPoolExecutor
+        ), patch(
+            "news_scraper.news_scraper._parse_worker", slow_parse
+        ), patch(
+            "news_scraper.news_scraper.os.cpu_count", return_value=2
+        ):
+            mock_cls.return_value.__aenter__.return_value = mock_session
+            articles = self.scraper.fetch_latest_articles(limit=20)
+
+        self.assertEqual(len(articles), 20)
+        self.assertLessEqual(max(peak), 2 + self.scraper.max_concurrency)
+
+    def test_collect_links(self):
+        """Test deduplicating hrefs and stopping as soon as the limit is met."""
+        consumed = []
+
+        def hrefs():
+            for href in ["/a", "/b", "/a", "/c", "/d"]:
+                consumed.append(href)
+                yield href
+
+        links = self.scraper._collect_links(hrefs(), "https://example.com", 3)
+
+        self.assertEqual(
+            links,
+            ["https://example.com/a", "https://example.com/b", "https://example.com/c"],
+        )
+        self.assertEqual(consumed, ["/a", "/b", "/a", "/c"])
+
+    def test_parse(self):
+        """Test parsing raw response bytes."""
+        tree = self.scraper._parse("<html><body><h1>Café</h1></body></html>".encode())
+
+        self.assertEqual(self.scraper._extract_title(tree), "Café")
+
+    def test_extract_content_ignores_text_between_paragraphs(self):
+        """Test that only paragraph text, not trailing siblings, is joined."""
+        tree = self.scraper._parse(b"<html><p> One &amp; </p>stray<p>Two</p></html>")
+
+        self.assertEqual(self.scraper._extract_content(tree), "One & Two")
+
+    def test_parse_skips_comments(self):
+        """Test that comments are dropped and do not leak into extracted text."""
+        tree = self.scraper._parse(b"<html><p>One<!-- ad --> two</p><!-- x --></html>")
+
+        self.assertEqual(tree.xpath("//comment()"), [])
+        self.assertEqual(self.scraper._extract_content(tree), "One two")
 
 
 class TestNYTimesScraper(unittest.TestCase):
@@ -83,8 +421,6 @@ class TestNYTimesScraper(unittest.TestCase):
     @patch("news_scraper.NYTimesScraper._make_request")
     def test_extract_title(self, mock_make_request):
         """Test extracting title from NYTimes article."""
-        from bs4 import BeautifulSoup
-
         html = """
         <html>
             <body>
@@ -92,11 +428,206 @@ class TestNYTimesScraper(unittest.TestCase):
             </body>
         </html>
         """
-        soup = BeautifulSoup(html, "html.parser")
+        tree = self.scraper._parse(html.encode())
 
-        title = self.scraper._extract_title(soup)
+        title = self.scraper._extract_title(tree)
         self.assertEqual(title, "Test Headline")
 
+    def test_parse_worker(self):
+        """Test extracting article fields without an initialised scraper."""
+        html = b"""
+        <html>
+            <body>
+                <h1 data-testid="headline">Test Headline</h1>
+                <p id="article-summary">Summary</p>
+            </body>
+        </html>
+        """
+        fields = _parse_worker(NYTimesScraper, html)
+
+        self.assertEqual(fields["title"], "Test Headline")
+        self.assertEqual(fields["summary"], "Summary")
+        self.assertNotIn("url", fields)
+
+    def test_extract_title_prefers_headline(self):
+        """Test that the headline selector wins over earlier plain h1 tags."""
+        html = b"""
+        <html>
+            <body>
+                <h1>Site Banner</h1>
+                <h1 data-testid="headline">Test Headline</h1>
+            </body>
+        </html>
+        """
+        tree = self.scraper._parse(html)
+
+        self.assertEqual(self.scraper._extract_title(tree), "Test Headline")
+
+    def test_extract_content_and_categories(self):
+        """Test extracting body paragraphs and meta categories."""
+        html = b"""
+        <html>
+            <head>
+                <meta property="article:section" content="World">
+                <meta property="article:tag" content="Politics">
+            </head>
+            <body>
+                <p>Not in the article.</p>
+                <section name="articleBody">
+                    <p> First paragraph. </p>
+                    <p>Second <b>paragraph</b>.</p>
+                </section>
+            </body>
+        </html>
+        """
+        tree = self.scraper._parse(html)
+
+        self.assertEqual(
+            self.scraper._extract_content(tree), "First paragraph. Second paragraph."
+        )
+        self.assertEqual(self.scraper._extract_categories(tree), ["World", "Politics"])
+
+    def test_get_article_urls(self):
+        """Test collecting recent, unique article links from the front page."""
+        year = datetime.now().year
+        html = f"""
+        <html>
+            <body>
+                <a href="/{year}/01/02/world/a.html">A</a>
+                <a href="/{year}/01/02/world/a.html">A again</a>
+                <a href="/{year - 1}/12/31/us/b.html">B</a>
+                <a href="/2001/09/11/us/old.html">Old</a>
+                <a href="https://example.com/{year}/c.html">External</a>
+                <a href="//cdn.example.com/{year}/d.js">Protocol-relative</a>
+                <a href="/section/world">Section</a>
+            </body>
+        </html>
+        """
+        mock_make_request = MagicMock(
+            side_effect=lambda *args, **kwargs: MagicMock(
+                status_code=200, raw=io.BytesIO(html.encode()), headers={}
+            )
+        )
+
+        with patch.object(self.scraper, "_make_request", mock_make_request):
+            urls = self.scraper._get_article_urls(limit=10)
+            limited = self.scraper._get_article_urls(limit=1)
+
+        self.assertEqual(
+            urls,
+            [
+                f"https://www.nytimes.com/{year}/01/02/world/a.html",
+                f"https://www.nytimes.com/{year - 1}/12/31/us/b.html",
+            ],
+        )
+        self.assertEqual(limited, urls[:1])
+
+    def test_article_and_link_caches_are_separate(self):
+        """Test that fetching the front page as an article keeps results apart."""
+        year = datetime.now().year
+        html = f"""<html><h1>Front</h1><a href="/{year}/01/02/a.html">A</a></html>"""
+
+        def page():
+            response = MagicMock(status_code=200, raw=io.BytesIO(html.encode()))
+            response.headers = {"ETag": '"front"'}
+            return response
+
+        not_modified = MagicMock(status_code=304)
+        with patch.object(
+            self.scraper.session,
+            "get",
+            side_effect=[page(), page(), not_modified, page()],
+        ) as mock_get, patch.object(self.scraper, "_respect_rate_limit"):
+            links = self.scraper._get_article_urls(limit=1)
+            article = self.scraper.fetch_article(self.scraper.base_url)
+            cached_article = self.scraper.fetch_article(self.scraper.base_url)
+            refetched_links = self.scraper._get_article_urls(limit=1)
+
+        # Each kind of result only revalidates against its own cache, and a
+        # fresh response for the URL drops the other kind's stale result
+        sent = [call[1]["headers"] for call in mock_get.call_args_list]
+        self.assertNotIn("If-None-Match", sent[1])
+        self.assertEqual(sent[2]["If-None-Match"], '"front"')
+        self.assertNotIn("If-None-Match", sent[3])
+        self.assertEqual(links, [f"https://www.nytimes.com/{year}/01/02/a.html"])
+        self.assertIsInstance(article, NewsArticle)
+        self.assertIs(cached_article, article)
+        self.assertEqual(refetched_links, links)
+
+    def test_fetch_latest_articles_with_cache_path(self):
+        """Test that a persisted cache serves a second run of unchanged pages."""
+
+        def fetch(cache_path, status, front_page):
+            scraper = NYTimesScraper(cache_path=cache_path)
+            scraper.rate_limit = 0
+            article = MagicMock(status=status, headers={"ETag": '"article"'})
+            article.read = AsyncMock(return_value=b"<html><h1>Cached</h1></html>")
+            session = MagicMock()
+            session.get.return_value.__aenter__.return_value = article
+
+            with patch.object(scraper.session, "get", return_value=front_page), patch(
+                "news_scraper.news_scraper.aiohttp.ClientSession"
+            ) as mock_cls:
+                mock_cls.return_value.__aenter__.return_value = session
+                articles = scraper.fetch_latest_articles(limit=1)
+            scraper.close()
+            return articles, session
+
+        year = datetime.now().year
+        html = f'<html><a href="/{year}/01/02/a.html">A</a></html>'
+        front_page = MagicMock(
+            status_code=200,
+            raw=io.BytesIO(html.encode()),
+            headers={"ETag": '"front"'},
+        )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = os.path.join(tmp, "nytimes")
+            first, _ = fetch(cache_path, 200, front_page)
+            second, session = fetch(cache_path, 304, MagicMock(status_code=304))
+
+        self.assertEqual([article.title for article in first], ["Cached"])
+        self.assertEqual([article.title for article in second], ["Cached"])
+        sent = session.get.call_args[1]["headers"]
+        self.assertEqual(sent["If-None-Match"], '"article"')
+
+
+class TestBBCScraper(unittest.TestCase):
+    def setUp(self):
+        """Set up a test BBC scraper."""
+        self.scraper = BBCScraper()
+
+    def test_abs_prefix(self):
+        """Test that article links resolve against the site origin."""
+        self.assertEqual(self.scraper._abs_prefix, "https://www.bbc.com")
+        self.assertEqual(
+            self.scraper._collect_links(
+                ["/news/world-1"], self.scraper._abs_prefix, 10
+            ),
+            ["https://www.bbc.com/news/world-1"],
+        )
+
+    def test_extract_article_fields(self):
+        """Test extracting BBC article fields with the compiled selectors."""
+        html = b"""
+        <html>
+            <body>
+                <h1>Banner</h1>
+                <h1 id="main-heading">BBC Headline</h1>
+                <div class="ssrcss-68pt20-Text-TextContributorName">Reporter</div>
+                <time>Yesterday</time>
+                <time datetime="2024-03-09T12:00:00.000Z">9 March</time>
+                <article><p>One.</p><p>Two.</p></article>
+            </body>
+        </html>
+        """
+        tree = self.scraper._parse(html)
+
+        self.assertEqual(self.scraper._extract_title(tree), "BBC Headline")
+        self.assertEqual(self.scraper._extract_author(tree), "Reporter")
+        self.assertEqual(self.scraper._extract_content(tree), "One. Two.")
+        self.assertEqual(self.scraper._extract_date(tree), "2024-03-09T12:00:00.000Z")
+
 
 if __name__ == "__main__":
     unittest.main()